@@ -1,5 +1,6 @@
 FEATURE_CODE = "dyn_trend_angle_30"
 import numpy as np, pandas as pd
+from _kernels import rolling_linreg_slope
 
 def compute_feature(df: pd.DataFrame) -> pd.Series:
     """
@@ -9,15 +10,8 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
 
     close = g["close"]
-    angles = pd.Series(index=close.index, dtype=float)
-
-    for i in range(29, len(close)):
-        y = close[i-29:i+1]
-        x = np.arange(30)
-        A = np.vstack([x, np.ones(len(x))]).T
-        m, _ = np.linalg.lstsq(A, y, rcond=None)[0]
-        angle = np.arctan(m) * (180 / np.pi)
-        angles.iat[i] = angle
+    m = rolling_linreg_slope(close.to_numpy(dtype=float), 30)
+    angles = pd.Series(np.arctan(m) * (180 / np.pi), index=close.index, dtype=float)
 
     angles.name = FEATURE_CODE
     return angles
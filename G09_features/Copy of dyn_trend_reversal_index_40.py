@@ -1,14 +1,14 @@
 FEATURE_CODE = "dyn_trend_reversal_index_40"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Trend Reversal Index over 40 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     rev_up = delta.clip(lower=0).rolling(40, min_periods=40).sum()
     rev_down = -delta.clip(upper=0).rolling(40, min_periods=40).sum()
 
@@ -1,14 +1,14 @@
 FEATURE_CODE = "dyn_trend_strength_ratio_50"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Trend Strength Ratio over 50 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     up = delta.clip(lower=0).rolling(50, min_periods=50).sum()
     down = -delta.clip(upper=0).rolling(50, min_periods=50).sum()
 
@@ -1,14 +1,14 @@
 FEATURE_CODE = "geo_trend_strength_balance_30"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Geometric Trend Strength Balance over 30 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     up_moves = delta.clip(lower=0).rolling(30, min_periods=30).sum()
     down_moves = -delta.clip(upper=0).rolling(30, min_periods=30).sum()
 
@@ -1,14 +1,14 @@
 FEATURE_CODE = "hybrid_entropy_trend_momentum_30"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Hybrid Entropy-Trend-Momentum Indicator over 30 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     trend = delta.rolling(30, min_periods=30).mean()
     momentum = delta.rolling(30, min_periods=30).std()
 
@@ -1,25 +1,22 @@
 FEATURE_CODE = "info_cross_entropy_price_volume_30"
 import numpy as np, pandas as pd
+from _kernels import rolling_cross_entropy
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Information Cross Entropy between Price and Volume over 30 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    price_returns = g["close"].pct_change()
-    vol_changes = g["volume"].pct_change()
+    price_returns = ctx.ret if ctx is not None else g["close"].pct_change()
+    vol_changes = ctx.vol_ret if ctx is not None else g["volume"].pct_change()
 
-    cross_entropy = pd.Series(index=g.index, dtype=float)
-
-    for i in range(29, len(g)):
-        pr = price_returns[i-29:i+1]
-        vc = vol_changes[i-29:i+1]
-        joint_dist = pd.crosstab(pr, vc, normalize=True)
-        marginal_pr = pr.value_counts(normalize=True)
-        ce = -np.sum(joint_dist.values * np.log(marginal_pr.reindex(joint_dist.index, fill_value=1e-10).values + 1e-10))
-        cross_entropy.iat[i] = ce
+    # -sum(p(pr, vc) * log(p(pr))) over the pd.crosstab(pr, vc) cells of each 30-bar window
+    cross_entropy = pd.Series(
+        rolling_cross_entropy(price_returns.to_numpy(dtype=float), vol_changes.to_numpy(dtype=float), 30),
+        index=g.index, dtype=float,
+    )
 
     cross_entropy.name = FEATURE_CODE
     return cross_entropy
@@ -1,14 +1,14 @@
 FEATURE_CODE = "info_return_direction_entropy_40"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Information Return Direction Entropy over 40 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     dir_changes = (delta > 0).astype(int) - (delta < 0).astype(int)
 
     direction_entropy = dir_changes.rolling(40, min_periods=40).apply(
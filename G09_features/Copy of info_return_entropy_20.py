@@ -1,17 +1,19 @@
 FEATURE_CODE = "info_return_entropy_20"
 import numpy as np, pandas as pd
+from _kernels import rolling_transform_sum
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Information Return Entropy over 20 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    returns = g["close"].pct_change().rolling(20, min_periods=20).apply(
-        lambda x: -np.sum((x + 1) * np.log(x + 1 + 1e-10)) / np.log(len(x))
-    )
+    x = ctx.ret if ctx is not None else g["close"].pct_change()
+    returns = -rolling_transform_sum(
+        x.to_numpy(dtype=float), 20, lambda v: (v + 1) * np.log(v + 1 + 1e-10)
+    ) / np.log(20)
 
-    s = returns.astype(float)
+    s = pd.Series(returns, index=x.index, dtype=float)
     s.name = FEATURE_CODE
     return s
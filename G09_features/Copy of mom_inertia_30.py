@@ -1,14 +1,14 @@
 FEATURE_CODE = "mom_inertia_30"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Momentum Inertia over 30 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     inertia = delta.rolling(30, min_periods=30).apply(lambda x: np.sum(x**2))
 
     s = inertia.astype(float)
@@ -1,14 +1,14 @@
 FEATURE_CODE = "mom_signed_energy_20"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Momentum Signed Energy over 20 periods.
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     signed_energy = delta.rolling(20, min_periods=20).apply(
         lambda x: np.sum(x**2) * np.sign(x[-1])
     )
@@ -1,5 +1,7 @@
 FEATURE_CODE = "trend_channel_touch_freq_50"
 import numpy as np, pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from _kernels import rolling_max, rolling_min
 
 def compute_feature(df: pd.DataFrame) -> pd.Series:
     """
@@ -8,17 +10,18 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    high = g["high"]
-    low = g["low"]
+    high = g["high"].to_numpy(dtype=float)
+    low = g["low"].to_numpy(dtype=float)
     close = g["close"]
 
     channel_touches = pd.Series(index=close.index, dtype=float)
 
-    for i in range(49, len(close)):
-        upper_channel = high[i-49:i+1].max()
-        lower_channel = low[i-49:i+1].min()
-        touches = ((close[i-49:i+1] >= upper_channel) | (close[i-49:i+1] <= lower_channel)).sum()
-        channel_touches.iat[i] = touches / 50
+    if len(close) >= 50:
+        upper_channel = rolling_max(high, 50)[49:, None]
+        lower_channel = rolling_min(low, 50)[49:, None]
+        win = sliding_window_view(close.to_numpy(dtype=float), 50)
+        touches = ((win >= upper_channel) | (win <= lower_channel)).sum(axis=1)
+        channel_touches.iloc[49:] = touches / 50
 
     channel_touches.name = FEATURE_CODE
     return channel_touches
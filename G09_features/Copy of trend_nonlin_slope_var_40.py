@@ -1,5 +1,6 @@
 FEATURE_CODE = "trend_nonlin_slope_var_40"
 import numpy as np, pandas as pd
+from _kernels import rolling_poly_resid_var
 
 def compute_feature(df: pd.DataFrame) -> pd.Series:
     """
@@ -9,15 +10,9 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
 
     close = g["close"]
-    slope_var = pd.Series(index=close.index, dtype=float)
-
-    for i in range(39, len(close)):
-        y = close[i-39:i+1]
-        x = np.arange(40)
-        coeffs = np.polyfit(x, y, 2)
-        poly = np.poly1d(coeffs)
-        residuals = y - poly(x)
-        slope_var.iat[i] = np.var(residuals)
+    # variance of the residuals of a quadratic fit over each window
+    v = rolling_poly_resid_var(close.to_numpy(dtype=float), 40, deg=2)
+    slope_var = pd.Series(v, index=close.index, dtype=float)
 
     slope_var.name = FEATURE_CODE
     return slope_var
@@ -0,0 +1,293 @@
+"""
+Throughput benchmark of the G09 feature modules.
+
+Every compute_feature runs on synthetic OHLCV of each requested length
+(e.g. 10k, 100k, 1M bars) with a fresh FeatureContext, so a feature is
+charged for the shared intermediates it uses. Per feature and length it
+records the best wall time of up to `repeat` runs (fast features only:
+no run is repeated after REPEAT_SECONDS in total), bars/sec and the peak
+traced memory (tracemalloc, measured in a separate run so tracing does
+not inflate the time). Features are ranked by time, slowest first.
+
+Before the full-length run each feature is timed on `probe_bars` bars;
+if the linear projection exceeds `budget` seconds the feature is skipped
+and reported with its projected time instead of stalling the suite.
+
+Results are written as a JSON baseline; a later run compared against it
+flags every feature whose time (or peak memory) grew by more than
+`threshold`. Command line:
+
+    python G09_features/_bench.py --bars 10000 100000 \\
+        --baseline bench.json [--update] [--threshold 0.25]
+
+exits with status 1 when a regression is found.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from _matrix import FeatureContext, call_feature, discover_features
+
+DEFAULT_BARS = (10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.25   # relative growth flagged as a regression
+DEFAULT_BUDGET = 300.0     # seconds per feature and length before skipping
+DEFAULT_REPEAT = 3
+REPEAT_SECONDS = 1.0       # no further repeats once the runs took this long
+PROBE_BARS = 2_000
+MIN_SECONDS = 0.05         # times below this are treated as equal (timer noise)
+MIN_PEAK_MB = 1.0
+
+
+def synthetic_ohlcv(n_bars, seed=0, freq="1min"):
+    """
+    Random-walk OHLCV frame of n_bars: tick-rounded closes (flat bars and
+    ties occur), open = previous close, high / low around the body and
+    lognormal volumes with occasional zero-volume bars.
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(2000 * np.exp(np.cumsum(rng.normal(0, 0.002, n_bars))), 2)
+    open_ = np.r_[close[:1], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.001, n_bars)) * close
+    volume = np.round(rng.lognormal(3, 1, n_bars), 3)
+    volume[rng.random(n_bars) < 0.01] = 0.0
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": volume,
+        },
+        index=pd.date_range("2020-01-01", periods=n_bars, freq=freq),
+    )
+
+
+def _run(fn, df):
+    gc.collect()
+    t = time.perf_counter()
+    call_feature(fn, FeatureContext(df))
+    return time.perf_counter() - t
+
+
+def _peak_mb(fn, df):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call_feature(fn, FeatureContext(df))
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_feature(fn, df, repeat=DEFAULT_REPEAT, memory=True, budget=DEFAULT_BUDGET,
+                      probe_bars=PROBE_BARS):
+    """
+    Benchmark one compute_feature on df.
+
+    Returns a dict with seconds, bars_per_sec, peak_mb and status
+    ("ok", "skipped" with the projected seconds, or "error" with the
+    exception text).
+    """
+    n = len(df)
+    result = {"bars": n, "seconds": None, "bars_per_sec": None, "peak_mb": None, "status": "ok"}
+    try:
+        if n > probe_bars:
+            projected = _run(fn, df.iloc[:probe_bars]) * n / probe_bars
+            if projected > budget:
+                result.update(status="skipped", projected_seconds=round(projected, 3),
+                              bars_per_sec=n / projected)
+                return result
+
+        times = [_run(fn, df)]
+        while len(times) < repeat and sum(times) < REPEAT_SECONDS:
+            times.append(_run(fn, df))
+        seconds = min(times)
+        result.update(seconds=seconds, bars_per_sec=n / seconds if seconds > 0 else float("inf"))
+        if memory:
+            result["peak_mb"] = _peak_mb(fn, df)
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    return result
+
+
+def run_benchmark(bars=DEFAULT_BARS, codes=None, features=None, repeat=DEFAULT_REPEAT, memory=True,
+                  budget=DEFAULT_BUDGET, seed=0, progress=None):
+    """
+    Benchmark the selected features (default: all) at every length in bars.
+
+    Returns {"meta": {...}, "results": {str(n_bars): {FEATURE_CODE: result}}}
+    where each result is a benchmark_feature() dict plus the module file.
+    progress, if given, is called as progress(n_bars, code, result).
+    """
+    features = features if features is not None else discover_features()
+    codes = list(features) if codes is None else list(codes)
+
+    results = {}
+    for n in bars:
+        df = synthetic_ohlcv(int(n), seed)
+        results[str(n)] = {}
+        for code in codes:
+            fn = features[code]
+            r = benchmark_feature(fn, df, repeat, memory, budget)
+            r["file"] = os.path.basename(fn.__code__.co_filename)
+            results[str(n)][code] = r
+            if progress is not None:
+                progress(n, code, r)
+
+    return {"meta": _environment(seed, repeat), "results": results}
+
+
+def _environment(seed, repeat):
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def rank_features(results):
+    """
+    (code, result, share of total time) of one length's results, slowest
+    first; skipped features rank by projected time, errors last.
+    """
+    def cost(r):
+        return r["seconds"] if r["status"] == "ok" else r.get("projected_seconds", -1.0)
+
+    ranked = sorted(results.items(), key=lambda item: -cost(item[1]))
+    total = sum(max(cost(r), 0.0) for r in results.values()) or 1.0
+    return [(code, r, max(cost(r), 0.0) / total) for code, r in ranked]
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Features slower (or using more peak memory) than in the baseline by
+    more than `threshold`, plus features that ran there but fail or are
+    skipped now.
+
+    Returns a list of dicts: bars, code, metric, baseline, current, ratio.
+    """
+    found = []
+    for n, current in results["results"].items():
+        base = baseline.get("results", {}).get(n, {})
+        for code, r in current.items():
+            b = base.get(code)
+            if b is None or b["status"] != "ok":
+                continue
+            if r["status"] != "ok":
+                found.append({"bars": int(n), "code": code, "metric": r["status"],
+                              "baseline": b["seconds"], "current": r.get("projected_seconds"),
+                              "ratio": None})
+                continue
+
+            for metric, floor in (("seconds", MIN_SECONDS), ("peak_mb", MIN_PEAK_MB)):
+                if r.get(metric) is None or b.get(metric) is None:
+                    continue
+                ratio = max(r[metric], floor) / max(b[metric], floor)
+                if ratio > 1 + threshold:
+                    found.append({"bars": int(n), "code": code, "metric": metric,
+                                  "baseline": b[metric], "current": r[metric], "ratio": ratio})
+    return found
+
+
+def format_report(results, regressions=(), top=None):
+    """Text report: per length the ranked features, then the regressions."""
+    lines = []
+    for n, current in results["results"].items():
+        lines.append(f"== {int(n):,} bars")
+        lines.append(f"{'rank':>4}  {'feature':40s} {'seconds':>9} {'bars/s':>12} {'peak MB':>8} {'share':>6}")
+        for k, (code, r, share) in enumerate(rank_features(current)[:top], 1):
+            if r["status"] == "ok":
+                peak = f"{r['peak_mb']:8.1f}" if r["peak_mb"] is not None else f"{'-':>8}"
+                lines.append(f"{k:4d}  {code:40s} {r['seconds']:9.3f} {r['bars_per_sec']:12,.0f} {peak} {share:6.1%}")
+            elif r["status"] == "skipped":
+                lines.append(f"{k:4d}  {code:40s} {'~' + format(r['projected_seconds'], '.0f'):>9} "
+                             f"{r['bars_per_sec']:12,.0f} {'-':>8} {share:6.1%}  skipped (over budget)")
+            else:
+                lines.append(f"{k:4d}  {code:40s} {'-':>9} {'-':>12} {'-':>8} {'':>6}  {r['error']}")
+
+    if regressions:
+        lines.append(f"== {len(regressions)} regression(s)")
+        for g in regressions:
+            if g["ratio"] is None:
+                lines.append(f"{g['bars']:>10,}  {g['code']:40s} {g['metric']} (was {g['baseline']:.3f}s)")
+            else:
+                lines.append(f"{g['bars']:>10,}  {g['code']:40s} {g['metric']}: "
+                             f"{g['baseline']:.3f} -> {g['current']:.3f} (x{g['ratio']:.2f})")
+    return "\n".join(lines)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def merge_results(baseline, results):
+    """baseline updated with the lengths / features measured in results."""
+    if baseline is None:
+        return results
+    merged = {"meta": results["meta"], "results": {n: dict(r) for n, r in baseline["results"].items()}}
+    for n, current in results["results"].items():
+        merged["results"].setdefault(n, {}).update(current)
+    return merged
+
+
+def save_baseline(path, results):
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(results, f, indent=1)
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the G09 feature modules.")
+    parser.add_argument("--bars", type=int, nargs="+", default=list(DEFAULT_BARS))
+    parser.add_argument("--only", nargs="+", metavar="CODE", help="benchmark these FEATURE_CODEs only")
+    parser.add_argument("--baseline", help="JSON baseline to compare against (written if missing)")
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--top", type=int, help="show only the N slowest features")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    def progress(n, code, r):
+        print(f"  {n:>10,}  {code:40s} {r['status']}", file=sys.stderr)
+
+    features = discover_features()
+    unknown = [code for code in args.only or () if code not in features]
+    if unknown:
+        parser.error(f"unknown FEATURE_CODE(s): {', '.join(unknown)}")
+
+    results = run_benchmark(args.bars, args.only, features, repeat=args.repeat,
+                            memory=not args.no_memory, budget=args.budget, seed=args.seed,
+                            progress=progress)
+
+    baseline, regressions = None, []
+    if args.baseline and os.path.exists(args.baseline):
+        baseline = load_baseline(args.baseline)
+        regressions = find_regressions(results, baseline, args.threshold)
+    print(format_report(results, regressions, args.top))
+
+    if args.baseline and (args.update or not os.path.exists(args.baseline)):
+        save_baseline(args.baseline, merge_results(baseline, results))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
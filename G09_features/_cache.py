@@ -0,0 +1,218 @@
+"""
+Content-addressed disk cache for G09 compute_feature outputs.
+
+An entry is one feature column saved as .npy and keyed on
+
+    FEATURE_CODE + source hash + input fingerprint
+
+where the source hash covers the module and the shared helpers its
+output depends on (SHARED_SOURCES: the _kernels window kernels and the
+_matrix FeatureContext intermediates), and the input fingerprint is the
+row count, first/last index value and a checksum of the (lowercased)
+OHLCV columns. Editing a module or a helper or changing the data
+therefore never reuses a stale column.
+
+When the input only gained bars at the end, the longest cached prefix is
+extended instead of recomputed: the feature runs on the last `warmup`
+cached bars plus the new ones, and the result is accepted only if its
+overlap with the cached column is identical (features with unbounded
+memory, e.g. cumulative sums or EWMs, fail that check and are recomputed
+in full). The cache directory is kept under a byte budget by evicting
+the least recently used entries.
+"""
+import glob
+import hashlib
+import json
+import os
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from _matrix import FeatureContext, call_feature
+
+DEFAULT_MAX_BYTES = 2 * 2**30
+DEFAULT_WARMUP = 500   # bars recomputed before the new tail (max G09 window: 50)
+OVERLAP_CHECK = 100    # cached bars the recomputed tail must reproduce exactly
+SHARED_SOURCES = ("_kernels.py", "_matrix.py")   # helpers next to the feature modules
+
+
+def _index_values(index):
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8
+    return index.to_numpy()
+
+
+def input_checksum(frame, stop=None):
+    """sha1 of the index and all columns of frame.iloc[:stop]."""
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(_index_values(frame.index[:stop])).tobytes())
+    for col in sorted(frame.columns):
+        h.update(str(col).encode())
+        h.update(np.ascontiguousarray(frame[col].to_numpy(dtype=np.float64)[:stop]).tobytes())
+    return h.hexdigest()
+
+
+def input_fingerprint(frame):
+    """Row count, first / last index value and checksum of a frame."""
+    n = len(frame)
+    return {
+        "n": n,
+        "first": str(frame.index[0]) if n else None,
+        "last": str(frame.index[-1]) if n else None,
+        "checksum": input_checksum(frame),
+    }
+
+
+class FeatureCache:
+    """
+    Disk cache of feature columns (see module docstring).
+
+    Use compute(frame_or_ctx, code, fn) in place of calling fn directly,
+    or pass the cache to compute_features / build_feature_matrix /
+    LazyFeatureFrame.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, warmup=DEFAULT_WARMUP):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.warmup = warmup
+        self.hits = self.extended = self.misses = 0
+        self._source_hashes = {}
+        self._fingerprints = {}  # id(frame) -> (weakref to frame, fingerprint)
+        os.makedirs(directory, exist_ok=True)
+
+    # --- keys ---
+
+    def source_hash(self, fn):
+        """sha1 of the source file defining fn and of the SHARED_SOURCES next to it."""
+        path = fn.__code__.co_filename
+        digest = self._source_hashes.get(path)
+        if digest is None:
+            directory = os.path.dirname(path)
+            h = hashlib.sha1()
+            for p in [path] + [os.path.join(directory, name) for name in SHARED_SOURCES]:
+                if os.path.exists(p):
+                    with open(p, "rb") as f:
+                        h.update(hashlib.sha1(f.read()).digest())
+            digest = h.hexdigest()
+            self._source_hashes[path] = digest
+        return digest
+
+    def _fingerprint(self, frame):
+        key = id(frame)
+        entry = self._fingerprints.get(key)
+        if entry is None or entry[0]() is not frame:
+            ref = weakref.ref(frame, lambda _, key=key: self._fingerprints.pop(key, None))
+            entry = self._fingerprints[key] = (ref, input_fingerprint(frame))
+        return entry[1]
+
+    def _stem(self, code, src, checksum):
+        return os.path.join(self.directory, f"{code}.{src[:12]}.{checksum[:16]}")
+
+    # --- entries ---
+
+    def _load(self, stem):
+        try:
+            values = np.load(stem + ".npy")
+        except (OSError, ValueError):
+            return None
+        os.utime(stem + ".npy")  # LRU: last use = mtime
+        return values
+
+    def _save(self, stem, values, meta):
+        for ext, write in ((".npy", lambda f: np.save(f, values)),
+                           (".json", lambda f: f.write(json.dumps(meta).encode()))):
+            tmp = f"{stem}{ext}.tmp{os.getpid()}"
+            with open(tmp, "wb") as f:
+                write(f)
+            os.replace(tmp, stem + ext)
+        self.evict()
+
+    def _prefix_entries(self, code, src, fp):
+        """Cached entries of (code, src) on a shorter input with the same first bar, longest first."""
+        found = []
+        for path in glob.glob(os.path.join(self.directory, f"{code}.{src[:12]}.*.json")):
+            try:
+                with open(path) as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if meta["first"] == fp["first"] and meta["n"] < fp["n"]:
+                found.append((meta, path[:-len(".json")]))
+        return sorted(found, key=lambda e: -e[0]["n"])
+
+    # --- public ---
+
+    def compute(self, frame_or_ctx, code, fn):
+        """Output of fn (FEATURE_CODE `code`) on the frame, as a float64 Series."""
+        ctx = frame_or_ctx if isinstance(frame_or_ctx, FeatureContext) else FeatureContext(frame_or_ctx)
+        frame = ctx.frame
+        src = self.source_hash(fn)
+        fp = self._fingerprint(frame)
+        stem = self._stem(code, src, fp["checksum"])
+
+        values = self._load(stem)
+        if values is not None and len(values) == fp["n"]:
+            self.hits += 1
+            return pd.Series(values, index=frame.index, name=code)
+
+        values = self._extend(frame, code, fn, src, fp)
+        if values is not None:
+            self.extended += 1
+        else:
+            self.misses += 1
+            values = self._as_array(call_feature(fn, ctx), frame.index)
+
+        self._save(stem, values, {"code": code, "source": src, **fp})
+        return pd.Series(values, index=frame.index, name=code)
+
+    def _extend(self, frame, code, fn, src, fp):
+        for meta, stem in self._prefix_entries(code, src, fp):
+            n = meta["n"]
+            if input_checksum(frame, n) != meta["checksum"]:
+                continue
+            cached = self._load(stem)
+            if cached is None or len(cached) != n:
+                continue
+
+            start = max(0, n - self.warmup)
+            tail_frame = frame.iloc[start:]
+            tail = self._as_array(call_feature(fn, FeatureContext(tail_frame)), tail_frame.index)
+
+            check = min(OVERLAP_CHECK, n - start)
+            overlap = tail[n - start - check:n - start]
+            if not np.array_equal(overlap, cached[n - check:n], equal_nan=True):
+                return None  # feature depends on more history than the warm-up
+            return np.concatenate([cached, tail[n - start:]])
+        return None
+
+    @staticmethod
+    def _as_array(s, index):
+        if not s.index.equals(index):
+            s = s.reindex(index)
+        return s.to_numpy(dtype=np.float64)
+
+    def size(self):
+        """Bytes used by cached columns."""
+        return sum(os.path.getsize(p) for p in glob.glob(os.path.join(self.directory, "*.npy")))
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "*.npy")):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for p in (path, path[:-len(".npy")] + ".json"):
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+            total -= size
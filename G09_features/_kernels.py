@@ -0,0 +1,353 @@
+"""
+Shared sliding-window kernels for the G09 rolling features.
+
+Every kernel takes a 1-D array and a window length w and returns a float
+array of the same length aligned like pandas' rolling(w, min_periods=w):
+the first w-1 values are NaN, and so is any window containing NaN unless
+the kernel says otherwise. Windows are processed in chunks of
+sliding_window_view rows, so memory stays bounded on long series.
+"""
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+CHUNK = 1 << 16  # windows materialized at once
+
+
+def _empty(n):
+    return np.full(n, np.nan)
+
+
+def map_windows(x, w, fn):
+    """
+    Apply fn to chunks of the (n-w+1, w) window matrix of x.
+
+    fn maps a (k, w) array of windows to k values; the result is aligned
+    so that out[t] belongs to the window ending at t.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = _empty(len(x))
+    if len(x) < w:
+        return out
+
+    win = sliding_window_view(x, w)
+    for s in range(0, len(win), CHUNK):
+        chunk = win[s:s + CHUNK]
+        out[w - 1 + s:w - 1 + s + len(chunk)] = fn(chunk)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Linear / polynomial regression on x = 0..w-1
+# ---------------------------------------------------------------------------
+
+def rolling_linreg_slope(y, w):
+    """Least-squares slope of y against 0..w-1 over each window."""
+    xc = np.arange(w, dtype=np.float64) - (w - 1) / 2.0
+    sxx = np.dot(xc, xc)
+    return map_windows(y, w, lambda win: win @ xc / sxx)
+
+
+def rolling_linreg_resid(y, w):
+    """Residual of the last point of each window from its linear fit."""
+    y = np.asarray(y, dtype=np.float64)
+    slope = rolling_linreg_slope(y, w)
+    mean = map_windows(y, w, lambda win: win.mean(axis=1))
+    return y - (mean + slope * (w - 1) / 2.0)
+
+
+def rolling_poly_resid_var(y, w, deg=2):
+    """
+    Variance (ddof=0) of the residuals of a degree-`deg` polynomial fit
+    over each window, i.e. np.var(y - np.poly1d(np.polyfit(x, y, deg))(x)).
+    """
+    x = np.arange(w, dtype=np.float64) - (w - 1) / 2.0
+    q, _ = np.linalg.qr(np.vander(x, deg + 1))
+    resid_proj = np.eye(w) - q @ q.T  # symmetric: residuals = win @ resid_proj
+    return map_windows(y, w, lambda win: (win @ resid_proj).var(axis=1))
+
+
+# ---------------------------------------------------------------------------
+# Moments
+# ---------------------------------------------------------------------------
+
+def _standardized_moment(win, k):
+    d = win - win.mean(axis=1, keepdims=True)
+    sd = np.sqrt((d * d).mean(axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = (d ** k).mean(axis=1) / sd ** k
+    return np.where(sd == 0, np.nan, m)
+
+
+def rolling_skew(x, w):
+    """Population skewness mean(((x - m) / sd) ** 3), sd with ddof=0; NaN if sd == 0."""
+    return map_windows(x, w, lambda win: _standardized_moment(win, 3))
+
+
+def rolling_kurt(x, w):
+    """Population (non-excess) kurtosis, sd with ddof=0; NaN if sd == 0."""
+    return map_windows(x, w, lambda win: _standardized_moment(win, 4))
+
+
+# ---------------------------------------------------------------------------
+# Weighted averages and order statistics
+# ---------------------------------------------------------------------------
+
+def rolling_wma(x, w):
+    """Linearly weighted moving average, weights 1..w (newest heaviest)."""
+    weights = np.arange(1, w + 1, dtype=np.float64)
+    weights /= weights.sum()
+    return map_windows(x, w, lambda win: win @ weights)
+
+
+def rolling_quantile(x, w, q):
+    """np.percentile(window, 100 * q) for a scalar or sequence q (rows = q)."""
+    qs = np.atleast_1d(np.asarray(q, dtype=np.float64)) * 100
+    x = np.asarray(x, dtype=np.float64)
+    out = np.full((len(qs), len(x)), np.nan)
+    if len(x) >= w:
+        win = sliding_window_view(x, w)
+        for s in range(0, len(win), CHUNK):
+            chunk = win[s:s + CHUNK]
+            out[:, w - 1 + s:w - 1 + s + len(chunk)] = np.percentile(chunk, qs, axis=1)
+    return out[0] if np.ndim(q) == 0 else out
+
+
+def rolling_iqr(x, w):
+    """Interquartile range np.percentile(window, 75) - np.percentile(window, 25)."""
+    q25, q75 = rolling_quantile(x, w, [0.25, 0.75])
+    return q75 - q25
+
+
+def _rolling_extreme(x, w, op):
+    # van Herk / Gil-Werman: block prefix and suffix scans give every
+    # window extreme in O(n), the vectorized form of a monotonic deque.
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    out = _empty(n)
+    if n < w:
+        return out
+
+    blocks = np.concatenate([x, np.full((-n) % w, np.nan)]).reshape(-1, w)
+    prefix = op.accumulate(blocks, axis=1).ravel()
+    suffix = op.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    start = np.arange(n - w + 1)
+    out[w - 1:] = op(suffix[start], prefix[start + w - 1])
+    return out
+
+
+def rolling_max(x, w):
+    """Max over each window, skipping NaN like Series.max(); NaN if all NaN."""
+    return _rolling_extreme(x, w, np.fmax)
+
+
+def rolling_min(x, w):
+    """Min over each window, skipping NaN like Series.min(); NaN if all NaN."""
+    return _rolling_extreme(x, w, np.fmin)
+
+
+# ---------------------------------------------------------------------------
+# Windowed histograms and entropies
+# ---------------------------------------------------------------------------
+
+class WindowHistogram:
+    """
+    Counts of the keys in a sliding window, updated in O(1) per sample.
+
+    Every key holds a tuple of `slots` counts (e.g. its joint and its
+    marginal occurrences). Alongside the counts the histogram keeps its
+    count-of-counts, `levels` (count tuple -> number of keys holding it),
+    so a sum over the histogram cells such as an entropy costs one term
+    per distinct count tuple - a handful in a short window - instead of a
+    rebuild of the histogram per window.
+    """
+
+    def __init__(self, slots=1):
+        self.zero = (0,) * slots
+        self.counts = {}
+        self.levels = {}
+        self.totals = [0] * slots
+
+    def _shift(self, key, slot, step):
+        old = self.counts.get(key, self.zero)
+        new = old[:slot] + (old[slot] + step,) + old[slot + 1:]
+        levels = self.levels
+        if old != self.zero:
+            if levels[old] == 1:
+                del levels[old]
+            else:
+                levels[old] -= 1
+        if new != self.zero:
+            levels[new] = levels.get(new, 0) + 1
+            self.counts[key] = new
+        else:
+            del self.counts[key]
+        self.totals[slot] += step
+
+    def add(self, key, slot=0):
+        self._shift(key, slot, 1)
+
+    def remove(self, key, slot=0):
+        self._shift(key, slot, -1)
+
+    def cell_sum(self, fn):
+        """sum(fn(*counts[key]) for every key), one fn call per distinct count tuple."""
+        return sum((m * fn(*c) for c, m in self.levels.items()), 0.0)
+
+
+def _slide(n, w, enter, leave, emit):
+    # Drive a WindowHistogram: sample t enters, sample t - w leaves, and
+    # emit() gives the value of the full window ending at t.
+    out = _empty(n)
+    for t in range(n):
+        enter(t)
+        if t >= w:
+            leave(t - w)
+        if t >= w - 1:
+            out[t] = emit()
+    return out
+
+
+def rolling_joint_entropy(x, y, w):
+    """
+    -sum(p * log(p + 1e-10)) over the joint histogram of the (x, y) value
+    pairs in each window, i.e. of pd.crosstab(x, y, normalize=True): pairs
+    with a NaN are dropped, a window without pairs gives -0.0.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = (~(np.isnan(x) | np.isnan(y))).tolist()
+    keys = list(zip(x.tolist(), y.tolist()))
+    hist = WindowHistogram()
+
+    def enter(t):
+        if valid[t]:
+            hist.add(keys[t])
+
+    def leave(t):
+        if valid[t]:
+            hist.remove(keys[t])
+
+    def emit():
+        n = hist.totals[0]
+        return -hist.cell_sum(lambda c: c / n * math.log(c / n + 1e-10))
+
+    return _slide(len(x), w, enter, leave, emit)
+
+
+def rolling_cross_entropy(x, y, w):
+    """
+    -sum(p(x, y) * log(p(x) + 1e-10)) over the joint histogram of the
+    (x, y) pairs in each window (NaN pairs dropped), p(x) being the
+    marginal frequency of the non-NaN x values of the window.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_valid = (~np.isnan(x)).tolist()
+    pair_valid = (~(np.isnan(x) | np.isnan(y))).tolist()
+    keys = x.tolist()
+    hist = WindowHistogram(slots=2)  # (pairs with this x, occurrences of x)
+
+    def enter(t):
+        if pair_valid[t]:
+            hist.add(keys[t], 0)
+        if x_valid[t]:
+            hist.add(keys[t], 1)
+
+    def leave(t):
+        if pair_valid[t]:
+            hist.remove(keys[t], 0)
+        if x_valid[t]:
+            hist.remove(keys[t], 1)
+
+    def emit():
+        n, m = hist.totals
+        return -hist.cell_sum(lambda a, b: a / n * math.log(b / m + 1e-10) if a else 0.0)
+
+    return _slide(len(x), w, enter, leave, emit)
+
+
+def rolling_counts(symbols, n_symbols, w):
+    """
+    (n - w + 1, n_symbols) occurrences of each symbol 0..n_symbols-1 in the
+    window ending at t = w-1..n-1: the running histogram, each row the
+    previous one plus the entering and minus the leaving sample.
+    """
+    onehot = np.zeros((len(symbols) + 1, n_symbols), dtype=np.int64)
+    onehot[np.arange(1, len(symbols) + 1), symbols] = 1
+    csum = np.cumsum(onehot, axis=0)
+    return csum[w:] - csum[:-w]
+
+
+def rolling_count_apply(symbols, n_symbols, w, fn):
+    """
+    fn(counts) of the rolling_counts() histogram of each window. fn runs
+    once per distinct histogram (at most C(w + n_symbols - 1, w) of them),
+    so it may be any scalar formula.
+    """
+    symbols = np.asarray(symbols, dtype=np.int64)
+    out = _empty(len(symbols))
+    if len(symbols) < w:
+        return out
+
+    levels, inverse = np.unique(rolling_counts(symbols, n_symbols, w), axis=0, return_inverse=True)
+    values = np.array([fn(counts) for counts in levels], dtype=np.float64)
+    out[w - 1:] = values[inverse.ravel()]
+    return out
+
+
+def rolling_transform_sum(x, w, fn):
+    """
+    Series.sum() of fn(window) over each complete window of x, with fn an
+    elementwise transform: NaN produced by fn is skipped like pandas does,
+    and +-inf in x counts as missing like in pandas' rolling().
+    """
+    x = np.asarray(x, dtype=np.float64)
+    x = np.where(np.isinf(x), np.nan, x)
+    out = _empty(len(x))
+    if len(x) < w:
+        return out
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fx = fn(x)
+    fx = np.where(np.isnan(fx), 0.0, fx)
+    sums = map_windows(fx, w, lambda win: win.sum(axis=1))
+
+    nan_count = np.concatenate([[0], np.cumsum(np.isnan(x))])
+    complete = (nan_count[w:] - nan_count[:-w]) == 0
+    out[w - 1:] = np.where(complete, sums[w - 1:], np.nan)
+    return out
+
+
+def rolling_histogram_entropy(x, w, bins):
+    """
+    -sum(p * log2(p)) over the non-empty bins of
+    np.histogram(window, bins=bins, density=True) for each finite window,
+    with the bin edges and bin assignment of numpy's equal-width path.
+    """
+    x = np.asarray(x, dtype=np.float64)
+
+    def entropy(win):
+        complete = np.isfinite(win).all(axis=1)
+        win = np.where(complete[:, None], win, 0.0)
+        first, last = win.min(axis=1), win.max(axis=1)
+        flat = first == last
+        first = np.where(flat, first - 0.5, first)
+        last = np.where(flat, last + 0.5, last)
+        edges = np.linspace(first, last, bins + 1, axis=1)
+
+        rows = np.arange(len(win))[:, None]
+        idx = ((win - first[:, None]) / (last - first)[:, None] * bins).astype(np.intp)
+        idx[idx == bins] -= 1
+        idx[win < edges[rows, idx]] -= 1
+        idx[(win >= edges[rows, idx + 1]) & (idx != bins - 1)] += 1
+
+        counts = (idx[:, :, None] == np.arange(bins)).sum(axis=1)
+        density = counts / np.diff(edges, axis=1) / counts.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(density > 0, density * np.log2(density), 0.0)
+        return np.where(complete, -terms.sum(axis=1), np.nan)
+
+    return map_windows(x, w, entropy)
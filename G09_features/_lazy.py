@@ -0,0 +1,118 @@
+"""
+Lazy feature frame over the G09 feature modules.
+
+LazyFeatureFrame wraps an OHLCV frame and exposes every discovered
+FEATURE_CODE as a virtual column next to the OHLCV columns. A feature is
+computed the first time its column is read (sharing one FeatureContext,
+so common intermediates are computed once) and kept in memory; with a
+cache (see _cache.FeatureCache) it is also saved as .npy and reloaded by
+later sessions on the same input and module source. Selecting a list of
+columns returns an ordinary DataFrame holding only those columns, so code
+that takes `df[cols]` computes only what it references.
+
+With timeframes, every feature is also a <FEATURE_CODE>_<tf> column
+computed on resampled bars and aligned to completed higher bars (see
+_timeframes.TimeframeFeatures).
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from _cache import FeatureCache
+from _matrix import FeatureContext, compute_features, discover_features
+from _timeframes import DEFAULT_TIMEFRAMES, TimeframeFeatures
+
+
+class LazyFeatureFrame:
+    """
+    OHLCV frame whose G09 features are computed on first access.
+
+    ohlcv is any frame with open/high/low/close/volume columns (any case).
+    features is a discover_features() result (default: all modules);
+    cache is None, a FeatureCache or a directory for one. timeframes
+    (True for 15m / 1h / 4h, or a {suffix: frequency} dict) adds the
+    higher-timeframe columns.
+
+    Supports the column access the pipeline uses: `columns`, `in`,
+    `lazy[name]` (Series), `lazy[[names]]` (DataFrame), `index`, `len`.
+    """
+
+    def __init__(self, ohlcv, features=None, cache=None, timeframes=None):
+        self.ctx = FeatureContext(ohlcv)
+        self.features = features if features is not None else discover_features()
+        self.cache = FeatureCache(cache) if isinstance(cache, (str, os.PathLike)) else cache
+        self.timeframes = None
+        if timeframes:
+            self.timeframes = TimeframeFeatures(
+                self.ctx, DEFAULT_TIMEFRAMES if timeframes is True else timeframes,
+                features=self.features, cache=self.cache)
+        self._columns = {}
+
+    @classmethod
+    def from_csv(cls, csv_path, features=None, cache=None, timeframes=None):
+        """LazyFeatureFrame over an OHLCV CSV (datetime index in the first column)."""
+        ohlcv = pd.read_csv(csv_path, parse_dates=True, index_col=0).sort_index()
+        return cls(ohlcv, features, cache, timeframes)
+
+    @property
+    def frame(self):
+        """The normalized (lowercased) OHLCV frame."""
+        return self.ctx.frame
+
+    @property
+    def index(self):
+        return self.frame.index
+
+    @property
+    def columns(self):
+        base = list(self.frame.columns)
+        names = [c for c in self.features if c not in base]
+        if self.timeframes is not None:
+            names += self.timeframes.names()
+        return pd.Index(base + names)
+
+    @property
+    def computed(self):
+        """Feature codes materialized so far."""
+        return list(self._columns)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def _timeframe_column(self, name):
+        return self.timeframes.parse(name) if self.timeframes is not None else None
+
+    def __contains__(self, name):
+        return (name in self.frame.columns or name in self.features
+                or self._timeframe_column(name) is not None)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        return pd.DataFrame({name: self.column(name) for name in key}, index=self.index)
+
+    def column(self, name):
+        """Column `name`: an OHLCV column, or a (timeframe) feature computed (or loaded) once."""
+        if name in self.frame.columns:
+            return self.frame[name]
+        if name in self._columns:
+            return self._columns[name]
+
+        if name in self.features:
+            s = compute_features(self.frame, [name], self.features, self.ctx, self.cache)[name]
+            if not s.index.equals(self.index):
+                s = s.reindex(self.index)
+        else:
+            parsed = self._timeframe_column(name)
+            if parsed is None:
+                raise KeyError(name)
+            s = self.timeframes.column(*parsed)
+        s = pd.Series(s.to_numpy(dtype=np.float64), index=self.index, name=name)
+
+        self._columns[name] = s
+        return s
+
+    def materialize(self, columns=None):
+        """DataFrame of the given columns (default: OHLCV + every feature)."""
+        return self[list(self.columns) if columns is None else list(columns)]
@@ -0,0 +1,208 @@
+"""
+Batch feature-matrix builder for the G09 feature modules.
+
+discover_features() loads every `compute_feature` module in this directory;
+build_feature_matrix() runs them all over one OHLCV frame and stacks the
+results into a single column-major matrix.
+
+The input is copied and its columns lowercased once (FeatureContext). Each
+module still receives a frame it may treat as its own, but its
+`df.copy()` becomes a cheap shallow copy, and modules that accept a `ctx`
+argument read the common intermediates (close diff, returns, log returns,
+true range / ATR, hl2, sign of diff) from a memo instead of recomputing
+them. Every column is identical to calling the module's compute_feature()
+directly on the same frame.
+"""
+import glob
+import importlib.util
+import inspect
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_module(path):
+    # feature modules import the shared helpers of their directory (_kernels)
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = "g09_" + re.sub(r"\W", "_", stem)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover_features(directory=None):
+    """
+    Load all feature modules of `directory` (default: this package).
+
+    Files starting with "_" are helpers and skipped. Returns a dict
+    FEATURE_CODE -> compute_feature, in file-name order.
+    """
+    directory = directory or _HERE
+    features = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+        if os.path.basename(path).startswith("_"):
+            continue
+        module = _load_module(path)
+        code = getattr(module, "FEATURE_CODE", None)
+        fn = getattr(module, "compute_feature", None)
+        if code is None or fn is None:
+            continue
+        if code in features:
+            raise ValueError(f"duplicate FEATURE_CODE {code!r} in {path}")
+        features[code] = fn
+    return features
+
+
+class _SharedFrame(pd.DataFrame):
+    # The context frame is shared by every feature; a module's defensive
+    # df.copy() only needs new column labels, not new data.
+    def copy(self, deep=True):
+        return pd.DataFrame.copy(self, deep=False)
+
+
+class FeatureContext:
+    """
+    One normalized frame plus memoized intermediates shared by all features.
+
+    frame has lowercased column names. The intermediates are computed with
+    exactly the expressions the feature modules use, on first access, and
+    must be treated as read-only.
+    """
+
+    def __init__(self, df):
+        frame = df.copy()
+        frame.columns = [str(c).lower() for c in frame.columns]
+        self.frame = _SharedFrame(frame)
+        self._memo = {}
+
+    def memo(self, key, fn):
+        """Value of fn() cached under key."""
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+    @property
+    def delta(self):
+        """close.diff()"""
+        return self.memo("delta", lambda: self.frame["close"].diff())
+
+    @property
+    def abs_delta(self):
+        """close.diff().abs()"""
+        return self.memo("abs_delta", lambda: self.delta.abs())
+
+    @property
+    def sign_delta(self):
+        """Sign of close.diff() as int64 (1 / -1 / 0, NaN -> 0)."""
+        return self.memo(
+            "sign_delta", lambda: np.sign(self.delta).fillna(0).astype(np.int64)
+        )
+
+    @property
+    def ret(self):
+        """close.pct_change()"""
+        return self.memo("ret", lambda: self.frame["close"].pct_change())
+
+    @property
+    def vol_ret(self):
+        """volume.pct_change()"""
+        return self.memo("vol_ret", lambda: self.frame["volume"].pct_change())
+
+    @property
+    def logret(self):
+        """log(close / close.shift(1))"""
+        close = self.frame["close"]
+        return self.memo("logret", lambda: np.log(close / close.shift(1)))
+
+    @property
+    def tr(self):
+        """True range max(high - low, |high - prev close|, |low - prev close|)."""
+        def true_range():
+            g = self.frame
+            prev_close = g["close"].shift(1)
+            return pd.concat([
+                g["high"] - g["low"],
+                (g["high"] - prev_close).abs(),
+                (g["low"] - prev_close).abs()], axis=1).max(axis=1)
+        return self.memo("tr", true_range)
+
+    def atr(self, n):
+        """Simple-average true range over n bars."""
+        return self.memo(("atr", n), lambda: self.tr.rolling(n, min_periods=n).mean())
+
+    @property
+    def hl2(self):
+        """(high + low) / 2"""
+        return self.memo("hl2", lambda: (self.frame["high"] + self.frame["low"]) / 2)
+
+
+def _accepts_ctx(fn):
+    try:
+        return "ctx" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def call_feature(fn, ctx):
+    """fn(ctx.frame), passing ctx to modules that accept it."""
+    return fn(ctx.frame, ctx=ctx) if _accepts_ctx(fn) else fn(ctx.frame)
+
+
+def compute_features(df, codes=None, features=None, ctx=None, cache=None):
+    """
+    Run the feature modules over df and return {FEATURE_CODE: Series}.
+
+    codes selects a subset (default: all discovered features); features is
+    a discover_features() result to reuse; ctx a FeatureContext to share;
+    cache a _cache.FeatureCache to read / store the columns (float64).
+    """
+    features = features if features is not None else discover_features()
+    codes = list(features) if codes is None else list(codes)
+    ctx = ctx if ctx is not None else FeatureContext(df)
+
+    out = {}
+    for code in codes:
+        fn = features[code]
+        try:
+            s = cache.compute(ctx, code, fn) if cache is not None else call_feature(fn, ctx)
+        except Exception as e:
+            raise RuntimeError(f"feature {code} failed") from e
+        out[code] = s
+    return out
+
+
+def build_feature_matrix(df, codes=None, dtype=np.float64, features=None, cache=None):
+    """
+    Compute the selected features of df into one matrix.
+
+    Returns
+    -------
+    X : np.ndarray
+        (n_bars, n_features) array of `dtype` (float32 or float64) in
+        column-major order, aligned to df.index.
+    codes : list of str
+        FEATURE_CODE of each column.
+
+    With a FeatureCache, columns already computed for the same module
+    source and input are loaded instead of recomputed.
+    """
+    ctx = FeatureContext(df)
+    series = compute_features(df, codes, features, ctx, cache)
+    codes = list(series)
+
+    X = np.empty((len(df), len(codes)), dtype=dtype, order="F")
+    for j, code in enumerate(codes):
+        s = series[code]
+        if not s.index.equals(ctx.frame.index):
+            s = s.reindex(ctx.frame.index)
+        X[:, j] = s.to_numpy(dtype=np.float64)
+    return X, codes
@@ -0,0 +1,248 @@
+"""
+Parity check of the G09 feature modules against their original versions.
+
+Every feature module whose source differs from the one at a reference
+git revision (default: the repository's first commit, i.e. the original
+implementations) is run in both versions on the same long synthetic
+OHLCV series. This covers the modules ported to the _kernels sliding-
+window library, the FeatureContext variants and the incremental entropy
+histograms. Two series are checked (parity_ohlcv):
+
+tick        tick-rounded closes (ties), zero-volume bars and flat
+            stretches where price and volume do not move, so degenerate
+            windows (zero range, zero variance, one histogram bin) are
+            exercised
+continuous  unrounded prices and volumes without ties, on which the
+            originals that fail on tied values still run
+
+The current module is run both directly (fn(df)) and through one shared
+FeatureContext (call_feature, as compute_features does). Per feature the
+report gives:
+
+status        "exact" (bit-identical incl. NaN positions), "close"
+              (within tolerance), "mismatch", "error" (the current
+              version raises) or "reference error" (the original raises
+              on this series: an upstream failure, not a regression)
+nan_mismatch  bars where only one side is NaN / inf
+max_abs_err   largest |current - original| over the finite bars
+max_rel_err   max_abs_err / max |original| (the feature's scale)
+t_ref, t_new  seconds of the original and the direct current call
+
+A feature passes when its NaN / inf positions agree and max_rel_err <=
+rtol. Command line:
+
+    python G09_features/_parity.py [--ref REV] [--bars 20000] \\
+        [--series tick continuous] [--rtol 1e-10] [--only CODE ...]
+
+exits with status 1 when a feature does not pass. The original window
+loops take several minutes per series at the default length.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+
+import numpy as np
+import pandas as pd
+
+from _matrix import _HERE, FeatureContext, _load_module, call_feature
+
+DEFAULT_BARS = 20_000
+DEFAULT_RTOL = 1e-10
+SERIES = ("tick", "continuous")
+FLAT_EVERY = 2_500   # one flat stretch per FLAT_EVERY bars (tick series)
+FLAT_BARS = 120      # longer than every feature window
+
+
+def parity_ohlcv(n_bars, series="tick", seed=0, freq="5min"):
+    """
+    Random-walk OHLCV frame of n_bars (see the module docstring): open =
+    previous close, high / low around the body, lognormal volumes.
+    """
+    if series not in SERIES:
+        raise ValueError(f"Unknown series {series!r} (use {' or '.join(SERIES)}).")
+    rng = np.random.default_rng(seed)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.002, n_bars)))
+    volume = rng.lognormal(3, 1, n_bars)
+    if series == "tick":
+        close = np.round(close, 2)
+        volume = np.round(volume, 3)
+        volume[rng.random(n_bars) < 0.01] = 0.0
+        for start in range(FLAT_EVERY // 2, n_bars, FLAT_EVERY):
+            stop = min(start + FLAT_BARS, n_bars)
+            close[start:stop] = close[start - 1]
+            volume[start:stop] = volume[start - 1]
+    open_ = np.r_[close[:1], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.001, n_bars)) * close
+    if series == "tick":
+        spread[open_ == close] = 0.0  # flat bars: high = low = close
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": volume,
+        },
+        index=pd.date_range("2020-01-01", periods=n_bars, freq=freq),
+    )
+
+
+def _git(args, directory):
+    return subprocess.run(["git", *args], cwd=directory, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def default_ref(directory=None):
+    """The first commit of the repository (the original feature modules)."""
+    return _git(["rev-list", "--max-parents=0", "HEAD"], directory or _HERE).split()[0]
+
+
+def changed_modules(ref, directory=None):
+    """File names of the feature modules that differ from (and exist at) ref."""
+    directory = directory or _HERE
+    names = _git(["diff", "--name-only", "--relative", ref, "--", "."], directory).splitlines()
+    out = []
+    for name in sorted(names):
+        if "/" in name or name.startswith("_") or not name.endswith(".py"):
+            continue
+        if os.path.exists(os.path.join(directory, name)):
+            out.append(name)
+    return out
+
+
+def _reference_module(ref, name, directory):
+    source = _git(["show", f"{ref}:./{name}"], directory)
+    module = types.ModuleType("g09_ref_" + os.path.splitext(name)[0].replace(" ", "_"))
+    module.__file__ = f"{ref}:{name}"
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def _compare(ref_values, values):
+    a = np.asarray(ref_values, dtype=np.float64)
+    b = np.asarray(values, dtype=np.float64)
+    if a.shape != b.shape:
+        return {"exact": False, "nan_mismatch": max(len(a), len(b)),
+                "max_abs_err": np.inf, "max_rel_err": np.inf}
+    fin_a, fin_b = np.isfinite(a), np.isfinite(b)
+    special = (np.isnan(a) & np.isnan(b)) | (~fin_a & ~fin_b & (a == b))
+    both = fin_a & fin_b
+    err = np.abs(a[both] - b[both])
+    max_abs = float(err.max()) if len(err) else 0.0
+    scale = float(np.abs(a[both]).max()) if len(err) else 0.0
+    return {
+        "exact": bool(((a == b) | special).all()),
+        "nan_mismatch": int((~both & ~special).sum()),
+        "max_abs_err": max_abs,
+        "max_rel_err": max_abs / scale if scale > 0 else max_abs,
+    }
+
+
+def check_parity(df, ref=None, codes=None, rtol=DEFAULT_RTOL, directory=None, progress=None):
+    """
+    Run the changed feature modules of directory at ref and now on df.
+
+    Returns a DataFrame indexed by FEATURE_CODE with the columns file,
+    status, nan_mismatch, max_abs_err, max_rel_err, t_ref, t_new, ok and
+    error (see the module docstring). codes restricts the check to these
+    FEATURE_CODEs.
+    """
+    directory = directory or _HERE
+    ref = ref or default_ref(directory)
+    ctx = FeatureContext(df)
+    frame = ctx.frame.copy(deep=True)  # plain frame with the same lowercase columns
+
+    rows = {}
+    for name in changed_modules(ref, directory):
+        module = _load_module(os.path.join(directory, name))
+        code = getattr(module, "FEATURE_CODE", None)
+        fn = getattr(module, "compute_feature", None)
+        if fn is None or (codes is not None and code not in codes):
+            continue
+        row = {"file": name, "status": "exact", "nan_mismatch": 0,
+               "max_abs_err": 0.0, "max_rel_err": 0.0, "ok": True}
+        try:
+            start = time.perf_counter()
+            expected = _reference_module(ref, name, directory).compute_feature(frame.copy())
+            row["t_ref"] = time.perf_counter() - start
+        except Exception as e:
+            row.update(status="reference error", ok=True, error=f"{type(e).__name__}: {e}")
+            rows[code] = row
+            if progress is not None:
+                progress(code, row)
+            continue
+        try:
+            start = time.perf_counter()
+            results = [fn(frame.copy())]
+            row["t_new"] = time.perf_counter() - start
+            results.append(call_feature(fn, ctx))
+        except Exception as e:
+            row.update(status="error", ok=False, error=f"{type(e).__name__}: {e}")
+            rows[code] = row
+            if progress is not None:
+                progress(code, row)
+            continue
+
+        same_labels = True
+        for s in results:
+            cmp = _compare(expected, s)
+            row["nan_mismatch"] = max(row["nan_mismatch"], cmp["nan_mismatch"])
+            row["max_abs_err"] = max(row["max_abs_err"], cmp["max_abs_err"])
+            row["max_rel_err"] = max(row["max_rel_err"], cmp["max_rel_err"])
+            same_labels &= s.name == expected.name and s.index.equals(expected.index)
+            if not cmp["exact"]:
+                row["status"] = "close"
+        row["ok"] = same_labels and row["nan_mismatch"] == 0 and row["max_rel_err"] <= rtol
+        if not row["ok"]:
+            row["status"] = "mismatch"
+        rows[code] = row
+        if progress is not None:
+            progress(code, row)
+
+    columns = ["file", "status", "nan_mismatch", "max_abs_err", "max_rel_err", "t_ref", "t_new", "ok", "error"]
+    return pd.DataFrame.from_dict(rows, orient="index").reindex(columns=columns).rename_axis("feature")
+
+
+def format_report(report):
+    lines = [f"{'feature':40s} {'status':16s} {'nan':>5s} {'max_abs_err':>12s} {'max_rel_err':>12s} "
+             f"{'t_ref':>8s} {'t_new':>8s}"]
+    for code, r in report.iterrows():
+        lines.append(f"{code:40s} {r['status']:16s} {r['nan_mismatch']:>5d} "
+                     f"{r['max_abs_err']:>12.3g} {r['max_rel_err']:>12.3g} "
+                     f"{r['t_ref']:>8.3f} {r['t_new']:>8.3f}")
+        if isinstance(r["error"], str):
+            lines.append(f"    {r['error']}")
+    counts = report["status"].value_counts()
+    lines.append(", ".join(f"{n} {status}" for status, n in counts.items()))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the G09 feature modules against their original versions.")
+    parser.add_argument("--ref", help="git revision of the original modules (default: first commit)")
+    parser.add_argument("--bars", type=int, default=DEFAULT_BARS)
+    parser.add_argument("--series", nargs="+", choices=SERIES, default=list(SERIES))
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--only", nargs="+", metavar="CODE", help="check these FEATURE_CODEs only")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    def progress(code, r):
+        print(f"  {code:40s} {r['status']}", file=sys.stderr)
+
+    ok = True
+    for series in args.series:
+        print(f"{series} series, {args.bars:,} bars", file=sys.stderr)
+        report = check_parity(parity_ohlcv(args.bars, series, args.seed), args.ref, args.only,
+                              args.rtol, progress=progress)
+        print(f"== {series} series, {args.bars:,} bars")
+        print(format_report(report))
+        ok &= bool(report["ok"].all())
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,569 @@
+"""
+Incremental (streaming) evaluation of the G09 features, one bar at a time.
+
+StreamingFeatureEngine.update(bar) returns every feature's value for the
+newest bar without recomputing the history:
+
+* Features with a native streamer (NATIVE_STREAMERS) keep O(1) rolling
+  state: Kahan running sums, EWM recursions, monotonic deques, lags. The
+  primitives replay pandas' own rolling/ewm recursions, so their values
+  are bit-identical to the batch compute_feature output.
+* Every other feature runs its compute_feature on the last `lookback`
+  bars (O(lookback) per bar); all of them share one tail frame and one
+  FeatureContext per bar. This is exact for finite-window features up to
+  floating-point summation order, as long as lookback covers the
+  feature's total window. Features that use whole-series statistics
+  (e.g. a full-history mean) have no streaming equivalent; replay()
+  reports them as mismatches.
+
+replay() streams a frame through the engine and compares every bar with
+the batch compute_feature output.
+"""
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from _matrix import compute_features, discover_features
+
+DEFAULT_LOOKBACK = 256  # bars kept for window-recomputed features (max G09 window: 50)
+
+NaN = float("nan")
+
+# pandas < 3 pads NaN prices before pct_change (fill_method="pad" default)
+_PCT_CHANGE_PADS = int(pd.__version__.split(".")[0]) < 3
+
+
+# ---------------------------------------------------------------------------
+# Streaming primitives (each mirrors one pandas operation)
+# ---------------------------------------------------------------------------
+
+class Lag:
+    """x.shift(k): the value seen k updates ago (NaN until then)."""
+
+    def __init__(self, k=1):
+        self._buf = deque([NaN] * k, maxlen=k)
+
+    def update(self, x):
+        out = self._buf[0]
+        self._buf.append(x)
+        return out
+
+
+class Diff:
+    """x.diff()"""
+
+    def __init__(self):
+        self._prev = NaN
+
+    def update(self, x):
+        out = x - self._prev
+        self._prev = x
+        return out
+
+
+class PctChange:
+    """x.pct_change() with the installed pandas' NaN filling."""
+
+    def __init__(self):
+        self._prev = NaN
+
+    def update(self, x):
+        if _PCT_CHANGE_PADS and x != x:
+            x = self._prev
+        out = x / self._prev - 1
+        self._prev = x
+        return out
+
+
+class CumSum:
+    """x.cumsum(): NaN inputs give NaN and are skipped by the running sum."""
+
+    def __init__(self):
+        self._sum = 0.0
+
+    def update(self, x):
+        if x != x:
+            return NaN
+        self._sum += x
+        return self._sum
+
+
+class CumProd:
+    """x.cumprod(), same NaN handling as CumSum."""
+
+    def __init__(self):
+        self._prod = 1.0
+
+    def update(self, x):
+        if x != x:
+            return NaN
+        self._prod *= x
+        return self._prod
+
+
+class RollingSum:
+    """
+    x.rolling(w, min_periods).sum() / .mean() as one running state.
+
+    Same Kahan-compensated add/remove recursion as pandas' roll_sum and
+    roll_mean (including the run-of-equal-values correction), so values
+    are bit-identical to the batch result.
+    """
+
+    def __init__(self, w, min_periods=None, mean=False):
+        self.w = w
+        self.min_periods = w if min_periods is None else min_periods
+        self.mean = mean
+        self._window = deque()
+        self._nobs = 0
+        self._neg_ct = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same = 0
+        self._prev = NaN
+
+    def _add(self, x):
+        if x == x:
+            self._nobs += 1
+            y = x - self._comp_add
+            t = self._sum + y
+            self._comp_add = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, x) < 0:
+                self._neg_ct += 1
+            self._same = self._same + 1 if x == self._prev else 1
+            self._prev = x
+
+    def _remove(self, x):
+        if x == x:
+            self._nobs -= 1
+            y = -x - self._comp_remove
+            t = self._sum + y
+            self._comp_remove = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, x) < 0:
+                self._neg_ct -= 1
+
+    def update(self, x):
+        x = float(x)
+        if len(self._window) == self.w:
+            self._remove(self._window.popleft())
+        self._window.append(x)
+        self._add(x)
+        return self._mean() if self.mean else self._total()
+
+    def _total(self):
+        nobs = self._nobs
+        if nobs == 0 == self.min_periods:
+            return 0.0
+        if nobs < self.min_periods:
+            return NaN
+        if self._same >= nobs:
+            return self._prev * nobs
+        return self._sum
+
+    def _mean(self):
+        nobs = self._nobs
+        if nobs < self.min_periods or nobs == 0:
+            return NaN
+        if self._same >= nobs:
+            return self._prev
+        result = self._sum / nobs
+        if self._neg_ct == 0 and result < 0:
+            return 0.0
+        if self._neg_ct == nobs and result > 0:
+            return 0.0
+        return result
+
+
+def RollingMean(w, min_periods=None):
+    """x.rolling(w, min_periods).mean() (see RollingSum)."""
+    return RollingSum(w, min_periods, mean=True)
+
+
+class RollingExtreme:
+    """
+    x.rolling(w, min_periods).max() / .min() with a monotonic deque:
+    O(1) amortized per update, NaN skipped but counted against min_periods.
+    """
+
+    def __init__(self, w, min_periods=None, op="max"):
+        self.w = w
+        self.min_periods = w if min_periods is None else min_periods
+        self._better = (lambda a, b: a >= b) if op == "max" else (lambda a, b: a <= b)
+        self._deque = deque()   # (position, value), values monotonic
+        self._valid = deque()   # validity flags of the current window
+        self._nobs = 0
+        self._t = 0
+
+    def update(self, x):
+        x = float(x)
+        t = self._t
+        self._t += 1
+
+        if len(self._valid) == self.w:
+            self._nobs -= self._valid.popleft()
+        if self._deque and self._deque[0][0] <= t - self.w:
+            self._deque.popleft()
+
+        valid = x == x
+        self._valid.append(valid)
+        self._nobs += valid
+        if valid:
+            while self._deque and self._better(x, self._deque[-1][1]):
+                self._deque.pop()
+            self._deque.append((t, x))
+
+        if self._nobs < self.min_periods or not self._deque:
+            return NaN
+        return self._deque[0][1]
+
+
+def RollingMax(w, min_periods=None):
+    return RollingExtreme(w, min_periods, "max")
+
+
+def RollingMin(w, min_periods=None):
+    return RollingExtreme(w, min_periods, "min")
+
+
+class EWMMean:
+    """
+    x.ewm(com/span/alpha, adjust, min_periods, ignore_na).mean()
+
+    Same recursion and parameter conversion as pandas' ewm kernel,
+    so values are bit-identical to the batch result.
+    """
+
+    def __init__(self, com=None, span=None, alpha=None, adjust=True,
+                 min_periods=0, ignore_na=False):
+        if com is None:
+            if span is not None:
+                com = (span - 1) / 2.0
+            elif alpha is not None:
+                com = (1 - alpha) / alpha
+            else:
+                raise ValueError("Must pass one of com, span or alpha.")
+        alpha = 1.0 / (1.0 + float(com))
+        self._old_wt_factor = 1.0 - alpha
+        self._new_wt = 1.0 if adjust else alpha
+        self._adjust = adjust
+        self._ignore_na = ignore_na
+        self._minp = max(int(min_periods), 1)
+        self._weighted = None
+        self._old_wt = 1.0
+        self._nobs = 0
+
+    def update(self, cur):
+        cur = float(cur)
+        is_observation = cur == cur
+        self._nobs += is_observation
+        weighted = self._weighted
+
+        if weighted is None:
+            weighted = cur
+        elif weighted == weighted:
+            if is_observation or not self._ignore_na:
+                self._old_wt *= self._old_wt_factor
+                if is_observation:
+                    # avoid numerical errors on constant series
+                    if weighted != cur:
+                        weighted = self._old_wt * weighted + self._new_wt * cur
+                        weighted /= self._old_wt + self._new_wt
+                    if self._adjust:
+                        self._old_wt += self._new_wt
+                    else:
+                        self._old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+
+        self._weighted = weighted
+        return weighted if self._nobs >= self._minp else NaN
+
+
+class TrueRange:
+    """max(high - low, |high - prev close|, |low - prev close|), NaN skipped."""
+
+    def __init__(self):
+        self._prev_close = Lag(1)
+
+    def update(self, bar):
+        pc = self._prev_close.update(bar["close"])
+        parts = [bar["high"] - bar["low"], abs(bar["high"] - pc), abs(bar["low"] - pc)]
+        parts = [p for p in parts if p == p]
+        return max(parts) if parts else NaN
+
+
+def _sign(x):
+    # 1 / -1 / 0 as in .apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    return 1 if x > 0 else (-1 if x < 0 else 0)
+
+
+def _nonzero(x):
+    # x.replace(0, np.nan)
+    return NaN if x == 0 else x
+
+
+# ---------------------------------------------------------------------------
+# Native streamers: factory() -> callable(bar) -> value
+# ---------------------------------------------------------------------------
+
+def _risk_atr_14():
+    tr, atr = TrueRange(), RollingMean(14)
+    return lambda bar: atr.update(tr.update(bar))
+
+
+def _smooth_hl_mid_10():
+    mean = RollingMean(10)
+    return lambda bar: mean.update((bar["high"] + bar["low"]) / 2)
+
+
+def _vol_rtr_pos_14():
+    tr, lo, hi = TrueRange(), RollingMin(14), RollingMax(14)
+
+    def update(bar):
+        x = tr.update(bar)
+        mn, mx = lo.update(x), hi.update(x)
+        return (x - mn) / _nonzero(mx - mn)
+    return update
+
+
+def _mom_signflip_12():
+    diff, flips = Diff(), RollingSum(12)
+    prev = [None]
+
+    def update(bar):
+        sign = _sign(diff.update(bar["close"]))
+        flip = prev[0] is None or sign != prev[0]
+        prev[0] = sign
+        return flips.update(int(flip))
+    return update
+
+
+def _reg_persist_dir_10():
+    diff, mean = Diff(), RollingMean(10)
+    return lambda bar: mean.update(_sign(diff.update(bar["close"])))
+
+
+def _trend_cum_return():
+    pct, prod = PctChange(), CumProd()
+
+    def update(bar):
+        r = pct.update(bar["close"])
+        return prod.update(1 + (0.0 if r != r else r)) - 1
+    return update
+
+
+def _ewm_spread(column, fast_span, slow_span, source=None):
+    # ewm(fast).mean() - ewm(slow).mean() of a bar column (or of source(bar))
+    fast = EWMMean(span=fast_span, adjust=False)
+    slow = EWMMean(span=slow_span, adjust=False)
+
+    def update(bar):
+        x = bar[column] if source is None else source(bar)
+        return fast.update(x) - slow.update(x)
+    return update
+
+
+def _mom_ret_accel_12():
+    pct = PctChange()
+    return _ewm_spread(None, 6, 12, source=lambda bar: pct.update(bar["close"]))
+
+
+def _dyn_trend_slope_ema_20():
+    ema, diff = EWMMean(span=20, adjust=False), Diff()
+    return lambda bar: diff.update(ema.update(bar["close"]))
+
+
+def _trend_ema_angle_20():
+    ema, diff, lag = EWMMean(span=20, adjust=False), Diff(), Lag(1)
+
+    def update(bar):
+        e = ema.update(bar["close"])
+        return float(np.arctan(diff.update(e) / lag.update(e)))
+    return update
+
+
+def _trend_epd_26():
+    ema, diff, mean = EWMMean(span=26, adjust=False), Diff(), RollingMean(26)
+
+    def update(bar):
+        close = bar["close"]
+        atr_like = mean.update(abs(diff.update(close)))
+        return (close - ema.update(close)) / _nonzero(atr_like)
+    return update
+
+
+def _osc_rsi_slope_14():
+    period = 14
+    delta, rsi_diff = Diff(), Diff()
+    gain = EWMMean(alpha=1 / period, adjust=False, min_periods=period)
+    loss = EWMMean(alpha=1 / period, adjust=False, min_periods=period)
+
+    def update(bar):
+        d = delta.update(bar["close"])
+        up, down = np.maximum(d, 0.0), -np.minimum(d, 0.0)  # NaN propagates like clip
+        rs = gain.update(up) / _nonzero(loss.update(down))
+        return rsi_diff.update(100 - (100 / (1 + rs)))
+    return update
+
+
+def _reg_ewm_slope_40():
+    t_ewm, c_ewm, tc_ewm, tt_ewm = (EWMMean(span=40, adjust=False) for _ in range(4))
+    step = [0.0]
+
+    def update(bar):
+        t = step[0]
+        step[0] += 1
+        close = float(bar["close"])
+        t_mean, c_mean = t_ewm.update(t), c_ewm.update(close)
+        cov = tc_ewm.update(t * close) - t_mean * c_mean
+        var = tt_ewm.update(t * t) - t_mean * t_mean  # Series ** 2 squares exactly
+        return cov / _nonzero(var)
+    return update
+
+
+def _trend_pvt_slope_20():
+    w = 20
+    pct, pvt_sum = PctChange(), CumSum()
+    t_m, p_m, tp_m, tt_m = (RollingMean(w) for _ in range(4))
+    step = [0.0]
+
+    def update(bar):
+        t = step[0]
+        step[0] += 1
+        pvt = pvt_sum.update(pct.update(bar["close"]) * bar["volume"])
+        t_mean, p_mean = t_m.update(t), p_m.update(pvt)
+        cov = tp_m.update(t * pvt) - t_mean * p_mean
+        var = tt_m.update(t * t) - t_mean * t_mean
+        return cov / _nonzero(var)
+    return update
+
+
+NATIVE_STREAMERS = {
+    "risk_atr_14": _risk_atr_14,
+    "smooth_hl_mid_10": _smooth_hl_mid_10,
+    "vol_rtr_pos_14": _vol_rtr_pos_14,
+    "mom_signflip_12": _mom_signflip_12,
+    "reg_persist_dir_10": _reg_persist_dir_10,
+    "trend_cum_return": _trend_cum_return,
+    "mom_ema_accel_14": lambda: _ewm_spread("close", 7, 14),
+    "vol_vmo_14": lambda: _ewm_spread("volume", 6, 14),
+    "mom_ret_accel_12": _mom_ret_accel_12,
+    "dyn_trend_slope_ema_20": _dyn_trend_slope_ema_20,
+    "trend_ema_angle_20": _trend_ema_angle_20,
+    "trend_epd_26": _trend_epd_26,
+    "osc_rsi_slope_14": _osc_rsi_slope_14,
+    "reg_ewm_slope_40": _reg_ewm_slope_40,
+    "trend_pvt_slope_20": _trend_pvt_slope_20,
+}
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class BarHistory:
+    """Ring buffer of the last `lookback` bars, materialized as a DataFrame."""
+
+    def __init__(self, lookback):
+        self.lookback = lookback
+        self._index = deque(maxlen=lookback)
+        self._rows = deque(maxlen=lookback)
+
+    def append(self, bar, timestamp):
+        self._index.append(timestamp)
+        self._rows.append(bar)
+
+    def frame(self):
+        return pd.DataFrame(list(self._rows), index=pd.Index(list(self._index)))
+
+
+class StreamingFeatureEngine:
+    """
+    Keeps per-feature state and returns all feature values bar by bar.
+
+    Parameters
+    ----------
+    codes : list of str, optional
+        Features to compute (default: all discovered).
+    lookback : int
+        Bars kept for features without a native streamer.
+    native : bool
+        Use NATIVE_STREAMERS where available (False: window-recompute all).
+    features : dict, optional
+        discover_features() result to reuse.
+    """
+
+    def __init__(self, codes=None, lookback=DEFAULT_LOOKBACK, native=True, features=None):
+        self.features = features if features is not None else discover_features()
+        self.codes = list(self.features) if codes is None else list(codes)
+        self.native = {
+            code: NATIVE_STREAMERS[code]()
+            for code in self.codes if native and code in NATIVE_STREAMERS
+        }
+        self.windowed = [code for code in self.codes if code not in self.native]
+        self.history = BarHistory(lookback) if self.windowed else None
+        self.n_bars = 0
+
+    def update(self, bar, timestamp=None):
+        """
+        Feed one bar (mapping of open/high/low/close/volume, any case) and
+        return {FEATURE_CODE: value} for it. timestamp is the bar's index
+        label (needed by time-of-day features); default: bar count.
+        """
+        bar = {str(k).lower(): v for k, v in bar.items()}
+        if timestamp is None:
+            timestamp = self.n_bars
+        self.n_bars += 1
+
+        values = {code: float(step(bar)) for code, step in self.native.items()}
+        if self.windowed:
+            self.history.append(bar, timestamp)
+            series = compute_features(self.history.frame(), self.windowed, self.features)
+            for code, s in series.items():
+                values[code] = float(s.iloc[-1])
+        return {code: values[code] for code in self.codes}
+
+
+def replay(df, codes=None, lookback=DEFAULT_LOOKBACK, native=True, features=None,
+           rtol=1e-9, atol=1e-12):
+    """
+    Stream df bar by bar through a fresh engine and compare with batch.
+
+    Returns a DataFrame indexed by FEATURE_CODE with columns: streamer
+    ("native"/"window"), exact (bit-identical incl. NaN positions),
+    nan_mismatch (bars where only one side is NaN), max_abs_err, and ok
+    (no NaN mismatch and |stream - batch| <= atol + rtol * |batch|).
+    """
+    features = features if features is not None else discover_features()
+    engine = StreamingFeatureEngine(codes, lookback, native, features)
+    codes = engine.codes
+
+    batch = compute_features(df, codes, features)
+    B = np.column_stack([batch[c].to_numpy(dtype=np.float64) for c in codes])
+
+    frame = df.copy()
+    frame.columns = [str(c).lower() for c in frame.columns]
+    S = np.empty_like(B)
+    for t, (ts, row) in enumerate(zip(frame.index, frame.to_dict("records"))):
+        values = engine.update(row, ts)
+        S[t] = [values[c] for c in codes]
+
+    nan_b, nan_s = np.isnan(B), np.isnan(S)
+    both = ~nan_b & ~nan_s
+    with np.errstate(invalid="ignore"):
+        err = np.where(both, np.abs(S - B), 0.0)
+        tol = np.where(both, atol + rtol * np.abs(B), np.inf)
+    same_bits = (S == B) | (nan_b & nan_s)
+
+    return pd.DataFrame({
+        "streamer": ["native" if c in engine.native else "window" for c in codes],
+        "exact": same_bits.all(axis=0),
+        "nan_mismatch": (nan_b != nan_s).sum(axis=0),
+        "max_abs_err": err.max(axis=0) if len(df) else np.zeros(len(codes)),
+        "ok": ((nan_b == nan_s) & (err <= tol)).all(axis=0),
+    }, index=pd.Index(codes, name="feature"))
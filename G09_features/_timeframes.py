@@ -0,0 +1,154 @@
+"""
+Higher-timeframe versions of the G09 features on the base (5m) grid.
+
+The base OHLCV frame is resampled once per timeframe (15m / 1h / 4h by
+default: open first, high max, low min, close last, volume sum, bars
+labelled by their open time like the base bars). Any compute_feature
+module then runs on the resampled frame, and its values are aligned back
+to the base index as of completed higher bars only:
+
+    higher bar [T, T + period) is complete when the base bar
+    [T + period - base, T + period) closes
+
+so the base bar labelled T + period - base is the first one to see it,
+and every base bar before it still sees the previous higher bar. No
+value ever depends on a base bar later than the one it is aligned to.
+
+Columns are named <FEATURE_CODE>_<timeframe>, e.g. risk_atr_14_1h.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from _matrix import FeatureContext, call_feature, discover_features
+
+DEFAULT_TIMEFRAMES = {"15m": "15min", "1h": "1h", "4h": "4h"}
+
+_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+def _period(rule):
+    return pd.Timedelta(to_offset(rule))
+
+
+def infer_base_period(index):
+    """Bar length of a DatetimeIndex (most common spacing)."""
+    if len(index) < 2:
+        raise ValueError("Need at least two bars to infer the base timeframe.")
+    return pd.Series(index[1:] - index[:-1]).mode().iloc[0]
+
+
+def resample_ohlcv(frame, rule):
+    """
+    OHLCV of frame (lowercase columns, datetime index) on `rule` bars
+    labelled and closed on the left (open time); bins without any base
+    bar are dropped.
+    """
+    agg = {c: how for c, how in _AGG.items() if c in frame.columns}
+    grouped = frame[list(agg)].resample(rule, label="left", closed="left")
+    out = grouped.agg(agg)
+    return out[grouped.size() > 0]
+
+
+def align_completed(values, period, base_index, base_period):
+    """
+    values (indexed by higher-bar open time) on base_index, each base bar
+    holding the value of the last higher bar completed by its close.
+    """
+    available = values.index + (period - base_period)
+    pos = available.searchsorted(base_index, side="right") - 1
+    data = values.to_numpy(dtype=np.float64)
+    out = np.full((len(base_index),) + data.shape[1:], np.nan)
+    hit = pos >= 0
+    out[hit] = data[pos[hit]]
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(out, index=base_index, columns=values.columns)
+    return pd.Series(out, index=base_index, name=values.name)
+
+
+class TimeframeFeatures:
+    """
+    Higher-timeframe feature columns of one base OHLCV frame.
+
+    Each timeframe is resampled once and gets its own FeatureContext (and
+    optional FeatureCache entries); column(code, tf) runs the module on
+    that frame and aligns it to the base index with align_completed().
+
+    timeframes maps a suffix to a pandas frequency (default 15m / 1h /
+    4h); each must be a whole multiple of the base bar length, which is
+    inferred from the index unless given.
+    """
+
+    def __init__(self, ohlcv, timeframes=None, base=None, features=None, cache=None):
+        self.base_ctx = ohlcv if isinstance(ohlcv, FeatureContext) else FeatureContext(ohlcv)
+        self.timeframes = dict(DEFAULT_TIMEFRAMES if timeframes is None else timeframes)
+        self.features = features if features is not None else discover_features()
+        self.cache = cache
+        index = self.base_ctx.frame.index
+        if not isinstance(index, pd.DatetimeIndex):
+            raise TypeError("Resampling needs a DatetimeIndex on the OHLCV frame.")
+        if not index.is_monotonic_increasing:
+            raise ValueError("The OHLCV index must be sorted to resample it.")
+        self.base_period = _period(base) if base is not None else infer_base_period(index)
+
+        for tf, rule in self.timeframes.items():
+            period = _period(rule)
+            if period <= self.base_period or period % self.base_period:
+                raise ValueError(f"Timeframe {tf} ({rule}) is not a multiple of the "
+                                 f"{self.base_period} base bars.")
+        self._contexts = {}
+
+    @property
+    def index(self):
+        return self.base_ctx.frame.index
+
+    def context(self, tf):
+        """FeatureContext over the resampled OHLCV of timeframe tf."""
+        ctx = self._contexts.get(tf)
+        if ctx is None:
+            ctx = self._contexts[tf] = FeatureContext(
+                resample_ohlcv(self.base_ctx.frame, self.timeframes[tf]))
+        return ctx
+
+    def frame(self, tf):
+        """Resampled OHLCV of timeframe tf."""
+        return self.context(tf).frame
+
+    def names(self, codes=None):
+        """Column names <code>_<tf> of the given codes (default: all) on every timeframe."""
+        codes = list(self.features) if codes is None else list(codes)
+        return [f"{code}_{tf}" for tf in self.timeframes for code in codes]
+
+    def parse(self, name):
+        """(code, tf) of a column name, or None if it is not a timeframe column."""
+        for tf in self.timeframes:
+            suffix = "_" + tf
+            if name.endswith(suffix) and name[:-len(suffix)] in self.features:
+                return name[:-len(suffix)], tf
+        return None
+
+    def raw(self, code, tf):
+        """Feature `code` on the bars of timeframe tf (indexed by their open time)."""
+        ctx, fn = self.context(tf), self.features[code]
+        try:
+            s = self.cache.compute(ctx, code, fn) if self.cache is not None else call_feature(fn, ctx)
+        except Exception as e:
+            raise RuntimeError(f"feature {code} on {tf} bars failed") from e
+        if not s.index.equals(ctx.frame.index):
+            s = s.reindex(ctx.frame.index)
+        return s
+
+    def column(self, code, tf):
+        """Feature `code` of timeframe tf aligned to the base index, named <code>_<tf>."""
+        s = align_completed(self.raw(code, tf), _period(self.timeframes[tf]),
+                            self.index, self.base_period)
+        s.name = f"{code}_{tf}"
+        return s
+
+    def compute(self, codes=None, timeframes=None):
+        """DataFrame on the base index of codes (default: all) on each timeframe."""
+        codes = list(self.features) if codes is None else list(codes)
+        tfs = list(self.timeframes) if timeframes is None else list(timeframes)
+        return pd.DataFrame({f"{code}_{tf}": self.column(code, tf) for tf in tfs for code in codes},
+                            index=self.index)
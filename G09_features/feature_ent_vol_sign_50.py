@@ -2,9 +2,10 @@ FEATURE_CODE = "ent_vol_sign_50"
 
 import numpy as np
 import pandas as pd
+from _kernels import rolling_count_apply
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Volatility Direction Entropy (50)
 
@@ -27,21 +28,21 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    v = g["close"].diff().abs()
-    sign = (v - v.shift(1)).apply(lambda x: -1 if x < 0 else (1 if x > 0 else 0))
+    v = ctx.abs_delta if ctx is not None else g["close"].diff().abs()
+    sign = np.sign((v - v.shift(1)).fillna(0.0).to_numpy(dtype=float))
 
-    def ent_window(arr):
-        n = len(arr)
+    def ent_window(counts):
+        # counts of sign -1, 0, 1 in the window
+        n = int(counts.sum())
         if n == 0:
             return np.nan
-        p_neg = np.count_nonzero(arr == -1) / n
-        p_zero = np.count_nonzero(arr == 0) / n
-        p_pos = np.count_nonzero(arr == 1) / n
+        p_neg = int(counts[0]) / n
+        p_zero = int(counts[1]) / n
+        p_pos = int(counts[2]) / n
         p = np.array([p_neg, p_zero, p_pos], dtype=float)
         p = p[p > 0]
         return -np.sum(p * (np.log(p) / np.log(2)))
 
-    s = sign.rolling(50, min_periods=50).apply(ent_window, raw=True)
-    s = s.astype(float)
+    s = pd.Series(rolling_count_apply(sign.astype(np.int64) + 1, 3, 50, ent_window), index=v.index, dtype=float)
     s.name = FEATURE_CODE
     return s
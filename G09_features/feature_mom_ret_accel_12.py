@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Smoothed Return Acceleration (12)
 
@@ -22,7 +22,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    r = g["close"].pct_change()
+    r = ctx.ret if ctx is not None else g["close"].pct_change()
     fast = r.ewm(span=6, adjust=False).mean()
     slow = r.ewm(span=12, adjust=False).mean()
 
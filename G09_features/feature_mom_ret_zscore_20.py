@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Rolling Return Z-Score (20)
 
@@ -26,7 +26,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    ret = g["close"].pct_change()
+    ret = ctx.ret if ctx is not None else g["close"].pct_change()
     mean = ret.rolling(20, min_periods=20).mean()
     std = ret.rolling(20, min_periods=20).std(ddof=0)
 
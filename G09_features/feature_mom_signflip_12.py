@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Smoothed Sign Flip Indicator (12)
 
@@ -23,7 +23,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
     close = g["close"]
 
-    sign = close.diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    sign = ctx.sign_delta if ctx is not None else close.diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
     flips = (sign != sign.shift(1)).astype(int)
 
     s = flips.rolling(12, min_periods=12).sum()
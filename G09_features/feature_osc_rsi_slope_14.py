@@ -1,12 +1,12 @@
 FEATURE_CODE = "osc_rsi_slope_14"
 import numpy as np, pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """Slope of RSI(14) indicator
     Automatically generated for Phase 1 — Metaheuristic Course.
     """
     g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
-    delta = g["close"].diff()
+    delta = ctx.delta if ctx is not None else g["close"].diff()
     up = delta.clip(lower=0); down = -delta.clip(upper=0)
     period = 14
     gain = up.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
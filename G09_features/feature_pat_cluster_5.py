@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Up/Down Movement Cluster Length (5)
 
@@ -28,7 +28,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
     close = g["close"]
 
-    sign = close.diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    sign = ctx.sign_delta if ctx is not None else close.diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
 
     def cluster(arr):
         if len(arr) < 5:
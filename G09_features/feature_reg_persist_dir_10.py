@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Persistent Direction Score (10)
 
@@ -25,8 +25,8 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    ret = g["close"].diff()
-    sign = ret.apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    ret = ctx.delta if ctx is not None else g["close"].diff()
+    sign = ctx.sign_delta if ctx is not None else ret.apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
 
     s = sign.rolling(10, min_periods=10).mean()
     s = s.astype(float)
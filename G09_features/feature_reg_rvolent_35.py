@@ -2,9 +2,10 @@ FEATURE_CODE = "reg_rvolent_35"
 
 import numpy as np
 import pandas as pd
+from _kernels import rolling_count_apply
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Return Volatility Entropy (35)
 
@@ -22,18 +23,18 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    v = g["close"].diff().abs()
-    sign = (v - v.shift(1)).apply(lambda x: -1 if x < 0 else (1 if x > 0 else 0))
+    v = ctx.abs_delta if ctx is not None else g["close"].diff().abs()
+    sign = np.sign((v - v.shift(1)).fillna(0.0).to_numpy(dtype=float))
 
-    def ent(arr):
-        n = len(arr)
+    def ent(counts):
+        # counts of sign -1, 0, 1 in the window
+        n = counts.sum()
         if n == 0:
             return np.nan
-        counts = [np.mean(arr == k) for k in [-1, 0, 1]]
-        p = np.array([x for x in counts if x > 0])
+        freqs = [c / n for c in counts]
+        p = np.array([x for x in freqs if x > 0])
         return -np.sum(p * (np.log(p) / np.log(2)))
 
-    s = sign.rolling(35, min_periods=35).apply(ent, raw=True)
-    s = s.astype(float)
+    s = pd.Series(rolling_count_apply(sign.astype(np.int64) + 1, 3, 35, ent), index=v.index, dtype=float)
     s.name = FEATURE_CODE
     return s
@@ -2,9 +2,10 @@ FEATURE_CODE = "reg_skewret_50"
 
 import numpy as np
 import pandas as pd
+from _kernels import rolling_skew
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Rolling Skewness of Returns (50)
 
@@ -21,16 +22,9 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    logret = np.log(g["close"] / g["close"].shift(1))
+    logret = ctx.logret if ctx is not None else np.log(g["close"] / g["close"].shift(1))
 
-    def skew(arr):
-        m = arr.mean()
-        sd = arr.std()
-        if sd == 0:
-            return np.nan
-        return np.mean(((arr - m) / sd) ** 3)
-
-    s = logret.rolling(50, min_periods=50).apply(skew, raw=True)
+    s = pd.Series(rolling_skew(logret.to_numpy(dtype=float), 50), index=logret.index)
     s = s.astype(float)
     s.name = FEATURE_CODE
     return s
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Volatility State Score (30)
 
@@ -22,7 +22,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    v = g["close"].diff().abs()
+    v = ctx.abs_delta if ctx is not None else g["close"].diff().abs()
 
     v_min = v.rolling(30, min_periods=30).min()
     v_max = v.rolling(30, min_periods=30).max()
@@ -2,6 +2,7 @@ FEATURE_CODE = "trend_hma_slope_21"
 
 import numpy as np
 import pandas as pd
+from _kernels import rolling_wma
 
 
 def compute_feature(df: pd.DataFrame) -> pd.Series:
@@ -26,20 +27,13 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     """
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
-    close = g["close"]
+    close = g["close"].to_numpy(dtype=float)
 
-    def wma(x, w):
-        return (x * w).sum() / w.sum()
-
-    w21 = np.arange(1, 22)
-    w10 = np.arange(1, 11)
-    wS = np.arange(1, int(np.sqrt(21)) + 1)
-
-    wma21 = close.rolling(21).apply(lambda x: wma(x, w21), raw=True)
-    wma10 = close.rolling(10).apply(lambda x: wma(x, w10), raw=True)
+    wma21 = rolling_wma(close, 21)
+    wma10 = rolling_wma(close, 10)
 
     fast = 2 * wma10 - wma21
-    hma = fast.rolling(len(wS)).apply(lambda x: wma(x, wS), raw=True)
+    hma = pd.Series(rolling_wma(fast, int(np.sqrt(21))), index=g.index)
 
     slope = hma.diff()
     slope = slope.astype(float)
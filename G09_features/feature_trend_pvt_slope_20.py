@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Price-Volume Trend Slope (20)
 
@@ -22,7 +22,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
 
     close, vol = g["close"], g["volume"]
-    ret = close.pct_change()
+    ret = ctx.ret if ctx is not None else close.pct_change()
     pvt = (ret * vol).cumsum()
 
     t = pd.Series(np.arange(len(pvt)), index=pvt.index, dtype=float)
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     ATR Normalized by Median ATR (14)
 
@@ -22,18 +22,22 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
 
     high, low, close = g["high"], g["low"], g["close"]
-    prev_close = close.shift(1)
-
-    tr = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    atr = tr.rolling(14, min_periods=14).mean()
+
+    if ctx is not None:
+        atr = ctx.atr(14)
+    else:
+        prev_close = close.shift(1)
+
+        tr = pd.concat(
+            [
+                high - low,
+                (high - prev_close).abs(),
+                (low - prev_close).abs(),
+            ],
+            axis=1,
+        ).max(axis=1)
+
+        atr = tr.rolling(14, min_periods=14).mean()
     med = atr.rolling(14, min_periods=14).median()
 
     s = atr / med.replace(0, np.nan)
@@ -2,6 +2,7 @@ FEATURE_CODE = "vol_iqr_20"
 
 import numpy as np
 import pandas as pd
+from _kernels import rolling_iqr
 
 
 def compute_feature(df: pd.DataFrame) -> pd.Series:
@@ -25,10 +26,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
     close = g["close"]
 
-    def iqr(arr):
-        return np.percentile(arr, 75) - np.percentile(arr, 25)
-
-    s = close.rolling(20, min_periods=20).apply(iqr, raw=True)
+    s = pd.Series(rolling_iqr(close.to_numpy(dtype=float), 20), index=close.index)
     s = s.astype(float)
     s.name = FEATURE_CODE
     return s
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Log-Volatility Change (1-bar)
 
@@ -26,7 +26,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    v = g["close"].diff().abs()
+    v = ctx.abs_delta if ctx is not None else g["close"].diff().abs()
     logv = np.log(v.replace(0, np.nan))
 
     s = logv.diff()
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Mean-Median Volatility Divergence (25)
 
@@ -21,7 +21,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    absret = g["close"].diff().abs()
+    absret = ctx.abs_delta if ctx is not None else g["close"].diff().abs()
 
     mean = absret.rolling(25, min_periods=25).mean()
     med = absret.rolling(25, min_periods=25).median()
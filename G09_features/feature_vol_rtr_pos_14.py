@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Relative True Range Position (14)
 
@@ -28,11 +28,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g.columns = [c.lower() for c in g.columns]
 
     high, low, close = g["high"], g["low"], g["close"]
-    prev_close = close.shift(1)
 
-    tr = pd.concat(
-        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
-    ).max(axis=1)
+    if ctx is not None:
+        tr = ctx.tr
+    else:
+        prev_close = close.shift(1)
+
+        tr = pd.concat(
+            [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+        ).max(axis=1)
 
     tr_min = tr.rolling(14, min_periods=14).min()
     tr_max = tr.rolling(14, min_periods=14).max()
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+def compute_feature(df: pd.DataFrame, ctx=None) -> pd.Series:
     """
     Volume-Price Correlation (20)
 
@@ -20,7 +20,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     g = df.copy()
     g.columns = [c.lower() for c in g.columns]
 
-    dc = g["close"].diff()
+    dc = ctx.delta if ctx is not None else g["close"].diff()
     v = g["volume"].astype(float)
 
     s = dc.rolling(20, min_periods=20).corr(v)